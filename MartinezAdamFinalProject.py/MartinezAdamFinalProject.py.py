@@ -16,24 +16,66 @@ Main Features:
 
 Validation:
 - The code ensures required fields are not empty.
-- Numeric fields are validated to ensure correct data types.
+- Numeric fields only accept digits (up to 9) as they are typed.
 - Error and success messages guide the user through data entry.
 """
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+from tkinter import font as tkfont
 from PIL import Image, ImageTk  # For handling images
 import sqlite3
+import os
+import threading
+import queue
+import weakref
+from datetime import datetime, timezone
+
+showerror = messagebox.showerror  # Used by every input validation and database error path
+
+INTENSITY_LEVELS = ("Low", "Medium", "High")  # Choices offered for activity intensity
+_INTENSITIES = frozenset(INTENSITY_LEVELS)    # Fast membership check when validating
+
+TAB_FONT = ('Arial', 12, 'bold')  # Font for the notebook tab labels
+
+MAX_DIGITS = 9  # Longest number accepted by numeric entries, well within SQLite's 64-bit INTEGER range
+
+HISTORY_LIMIT = 200  # Maximum number of recent records shown in each history list
+
+# (column id, heading, width) of the history lists, in the order the columns are selected from the database
+ACTIVITY_COLUMNS = (("activity_name", "Activity", 160), ("duration", "Duration (min)", 100),
+                    ("intensity", "Intensity", 80), ("date", "Date", 90))
+NUTRITION_COLUMNS = (("food_item", "Food Item", 160), ("calories", "Calories", 70), ("carbs", "Carbs (g)", 70),
+                     ("protein", "Protein (g)", 70), ("fats", "Fats (g)", 70), ("date", "Date", 90))
+
+# Placeholder text shown in an empty history list
+ACTIVITY_EMPTY = "No activities logged yet."
+NUTRITION_EMPTY = "No nutrition records found."
 
 # ---------------------- Database Setup ----------------------
+def connect_database(**kwargs):
+    """
+    Opens a connection to the SQLite database and applies the per-connection tuning PRAGMAs.
+    synchronous=NORMAL is safe under WAL and avoids an fsync on every commit.
+    """
+    conn = sqlite3.connect('fitness_tracker.db', **kwargs)
+    conn.execute("PRAGMA synchronous=NORMAL")  # Fewer fsyncs per commit
+    conn.execute("PRAGMA temp_store=MEMORY")   # Keep temporary tables and indices in memory
+    conn.execute("PRAGMA cache_size=-8000")    # 8MB page cache
+    return conn
+
+
 def setup_database():
     """
     Initializes the SQLite database with tables for activities, nutrition, and goals if they don't already exist.
     This ensures the database is ready before the GUI runs.
     """
-    conn = sqlite3.connect('fitness_tracker.db')  # Connect to SQLite database
+    conn = connect_database()  # Connect to SQLite database
     cursor = conn.cursor()  # Create a cursor to execute SQL commands
 
+    # WAL journaling is stored in the database file, so it persists for every later connection
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     # Create 'activities' table if it doesn't exist
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS activities (
@@ -61,16 +103,52 @@ def setup_database():
     # Create 'goals' table if it doesn't exist
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS goals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id INTEGER PRIMARY KEY,
             weekly_exercise_goal INTEGER,
             daily_calorie_limit INTEGER
         )
     """)
 
+    # Indexes so the history lists can read the most recent records without a full table scan
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_activities_date ON activities(date DESC, id DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_nutrition_date ON nutrition(date DESC, id DESC)")
+
+    # Goals are stored in a single row with id 1; move the latest goals of older databases there
+    # (only needed once, so an already migrated database is not rewritten on every launch)
+    cursor.execute("SELECT COUNT(*) FROM goals WHERE id <> 1")
+    if cursor.fetchone()[0]:
+        cursor.execute("DELETE FROM goals WHERE id <> (SELECT MAX(id) FROM goals)")
+        cursor.execute("UPDATE goals SET id = 1 WHERE id <> 1")
+    # Create the (empty) goals row so set_goals only ever has to update it in place
+    cursor.execute("INSERT OR IGNORE INTO goals (id, weekly_exercise_goal, daily_calorie_limit) VALUES (1, NULL, NULL)")
+
     conn.commit()  # Save changes
     conn.close()    # Close connection
 
 
+# ---------------------- Style Setup ----------------------
+_styled_roots = weakref.WeakSet()  # Tk roots whose interpreter already has the application style
+
+
+def configure_style(root, base_bg, fg, highlight, list_font):
+    """
+    Applies the notebook and history list style used by the application to the given Tk root's interpreter.
+    ttk styles are shared by every window of an interpreter, so each root is only configured once.
+    """
+    if root in _styled_roots:
+        return
+
+    style = ttk.Style(root)
+    style.theme_use("clam")  # Use the 'clam' theme for a clean look
+    style.configure("TNotebook", background=base_bg, borderwidth=0)
+    style.configure("TNotebook.Tab", background=base_bg, foreground=fg, font=TAB_FONT)
+    style.map("TNotebook.Tab",
+              background=[("selected", highlight)],
+              foreground=[("selected", "black")])
+    style.configure("Treeview", font=list_font)
+    _styled_roots.add(root)
+
+
 # ---------------------- Main Application Class ----------------------
 class FitnessApp(tk.Tk):
     """
@@ -90,24 +168,80 @@ class FitnessApp(tk.Tk):
 
         self.configure(bg=self.base_bg)  # Apply base background color to main window
 
+        # Named fonts created once and shared by every widget
+        self.font_label = tkfont.Font(family="Arial", size=11)                 # Labels
+        self.font_bold = tkfont.Font(family="Arial", size=11, weight="bold")   # Buttons
+        self.font_title = tkfont.Font(family="Arial", size=12, weight="bold")  # Headings and goal status
+        self.font_list = tkfont.Font(family="Arial", size=10)                  # History lists
+
+        # Entry validation that only allows whole numbers of up to MAX_DIGITS digits to be typed into numeric fields
+        self._vcmd_int = (self.register(lambda value: value == "" or (value.isdecimal() and len(value) <= MAX_DIGITS)),
+                          "%P")
+
+        # Open one database connection that is reused for the lifetime of the application
+        self.conn = connect_database(check_same_thread=False, cached_statements=128)
+        self.conn.row_factory = sqlite3.Row  # Allow column-name access on fetched rows
+        self.cursor = self.conn.cursor()
+        self._goal_cache = None  # Last known (weekly_exercise_goal, daily_calorie_limit), filled on first use
+
+        # Background thread that performs database writes so the GUI never waits on disk I/O
+        self.db_queue = queue.Queue()    # Write tasks for the database thread
+        self.db_results = queue.Queue()  # Completion callbacks to run on the Tk main thread
+        self.db_thread = threading.Thread(target=self._db_worker, daemon=True)
+        self.db_thread.start()
+        self.after(50, self._process_db_results)
+
+        # Closing the window with the title-bar button shuts down the same way as the Exit button
+        self.protocol("WM_DELETE_WINDOW", self.shutdown)
+
         # Call method to initialize the UI
         self.init_ui()
 
+    def _db_worker(self):
+        """
+        Runs on the background thread with its own database connection (connections are per-thread).
+        Executes queued (write, args, on_success) tasks and hands on_success back to the Tk main thread.
+        A None task stops the worker. Tk is never called from this thread.
+        """
+        conn = connect_database(cached_statements=128)
+        while True:
+            task = self.db_queue.get()
+            if task is None:
+                break
+            write, args, on_success = task
+            try:
+                write(conn, *args)
+            except Exception as e:  # Report any failure and keep serving later writes
+                self.db_results.put(lambda e=e: showerror("Database Error", f"Could not save data: {e}"))
+            else:
+                self.db_results.put(on_success)
+        conn.close()
+
+    def _process_db_results(self):
+        """
+        Runs the callbacks of completed database writes on the Tk main thread, then reschedules itself.
+        """
+        try:
+            self._run_db_results()
+        finally:
+            self.after(50, self._process_db_results)  # A failing callback must not stop later results
+
+    def _run_db_results(self):
+        """
+        Runs every callback currently waiting in db_results.
+        """
+        while not self.db_results.empty():
+            self.db_results.get()()
+
     def init_ui(self):
         """
         Initializes the application user interface. This method:
         - Sets up a ttk.Notebook with three tabs.
-        - Calls initialization methods for each tab.
+        - Defers each tab's initialization until the tab is first shown.
         - Applies a custom style for a consistent look.
         """
         # Configure the style for the notebook and its tabs
-        style = ttk.Style()
-        style.theme_use("clam")  # Use the 'clam' theme for a clean look
-        style.configure("TNotebook", background=self.base_bg, borderwidth=0)
-        style.configure("TNotebook.Tab", background=self.base_bg, foreground=self.fg_color, font=('Arial', 12, 'bold'))
-        style.map("TNotebook.Tab",
-                  background=[("selected", self.highlight_color)],
-                  foreground=[("selected", "black")])
+        configure_style(self, self.base_bg, self.fg_color, self.highlight_color, self.font_list)
 
         # Create a notebook widget to hold tabs
         notebook = ttk.Notebook(self)  # 'self' is the main window
@@ -123,14 +257,86 @@ class FitnessApp(tk.Tk):
         notebook.add(self.nutrition_tab, text="Nutrition Logging")
         notebook.add(self.goal_tab, text="Goal Setting")
 
-        # Load images for Activity and Nutrition tabs
-        self.load_activity_image()
-        self.load_nutrition_image()
+        # Initialize each tab's content and functionality the first time it is shown
+        self._initialized = {"activity": False, "nutrition": False, "goal": False}
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._init_tab(notebook.select())  # The first tab is shown immediately
 
-        # Initialize each tab's content and functionality
-        self.init_activity_tab()
-        self.init_nutrition_tab()
-        self.init_goal_tab()
+    def _on_tab_changed(self, event):
+        """
+        Handles <<NotebookTabChanged>> by initializing the newly selected tab if needed.
+        """
+        self._init_tab(event.widget.select())
+
+    def _init_tab(self, tab_id):
+        """
+        Initializes the tab with the given notebook tab id exactly once.
+        """
+        tabs = {
+            str(self.activity_tab): ("activity", self.init_activity_tab),
+            str(self.nutrition_tab): ("nutrition", self.init_nutrition_tab),
+            str(self.goal_tab): ("goal", self.init_goal_tab),
+        }
+        name, init = tabs[str(tab_id)]
+        if not self._initialized[name]:
+            self._initialized[name] = True
+            init()
+
+    def _label(self, parent, text, row):
+        """
+        Creates a right-aligned form label in the application's color scheme in the first column of the given row.
+        """
+        tk.Label(parent, text=text, bg=self.frame_bg, fg=self.fg_color, font=self.font_label).grid(row=row, column=0, padx=10, pady=5, sticky="e")
+
+    def _history_list(self, parent, columns, empty_message):
+        """
+        Creates a Treeview with one heading per (column id, heading, width) entry in columns.
+        The first column is widened if needed so empty_message, shown there when the list is empty, fits.
+        Only the visible rows are drawn, however many records the list holds.
+        """
+        tree = ttk.Treeview(parent, columns=[column for column, _, _ in columns], show="headings", height=15)
+        for column, heading, width in columns:
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, anchor="w")
+        first_column, _, first_width = columns[0]
+        tree.column(first_column, width=max(first_width, self.font_list.measure(empty_message) + 16))  # + cell padding
+        return tree
+
+    def _fill_history(self, tree, rows, empty_message):
+        """
+        Replaces the contents of a history list with the given rows.
+        If there are no rows, shows empty_message in a placeholder row instead.
+        """
+        tree.delete(*tree.get_children())
+        for row in rows:
+            tree.insert("", tk.END, values=tuple(row))
+        if not tree.get_children():
+            tree.insert("", tk.END, iid="placeholder", values=(empty_message,))
+
+    def _prepend_history(self, tree, values):
+        """
+        Adds a single new record to the top of a history list, keeping it to HISTORY_LIMIT rows.
+        """
+        if tree.exists("placeholder"):
+            tree.delete("placeholder")  # Replace the 'no records' message with the first entry
+        tree.insert("", 0, values=values)
+        tree.delete(*tree.get_children()[HISTORY_LIMIT:])
+
+    def load_thumbnail(self, path, cache_path):
+        """
+        Returns a 200x150 Tkinter image for the given JPEG.
+        The resized image is saved as a PNG at cache_path so later launches skip decoding and resampling;
+        the cache is rebuilt whenever the source image is newer than it.
+        """
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            img = Image.open(cache_path)  # Already resized, load as-is
+        else:
+            img = Image.open(path).resize((200, 150), Image.Resampling.LANCZOS)  # Load and resize image
+            try:
+                img.save(cache_path, optimize=True)  # Cache the resized image for the next launch
+            except OSError as e:
+                print("Error caching resized image:", e)  # Still usable, just not cached
+        return ImageTk.PhotoImage(img)  # Convert PIL image to Tkinter image
 
     def load_activity_image(self):
         """
@@ -138,8 +344,7 @@ class FitnessApp(tk.Tk):
         If the image is not found, prints an error message.
         """
         try:
-            img = Image.open(r"E:\guiImages\fitnessgui1.jpg").resize((200, 150), Image.Resampling.LANCZOS)  # Load and resize image
-            self.activity_image = ImageTk.PhotoImage(img)  # Convert PIL image to Tkinter image
+            self.activity_image = self.load_thumbnail(r"E:\guiImages\fitnessgui1.jpg", "fitnessgui1_200x150.png")
             # Create a label to hold the image
             img_label = tk.Label(self.activity_tab, image=self.activity_image, bg=self.frame_bg)
             img_label.grid(row=0, column=2, rowspan=4, padx=20, pady=20, sticky="n")
@@ -152,8 +357,7 @@ class FitnessApp(tk.Tk):
         If the image is not found, prints an error message.
         """
         try:
-            img = Image.open(r"E:\guiImages\fitnessgui2.jpg").resize((200, 150), Image.Resampling.LANCZOS)  # Load and resize image
-            self.nutrition_image = ImageTk.PhotoImage(img)  # Convert PIL image to Tkinter-compatible format
+            self.nutrition_image = self.load_thumbnail(r"E:\guiImages\fitnessgui2.jpg", "fitnessgui2_200x150.png")
             # Create a label to hold the image
             img_label = tk.Label(self.nutrition_tab, image=self.nutrition_image, bg=self.frame_bg)
             img_label.grid(row=0, column=2, rowspan=5, padx=20, pady=20, sticky="n")
@@ -163,31 +367,36 @@ class FitnessApp(tk.Tk):
     def init_activity_tab(self):
         """
         Initializes the Activity Tracking tab by:
+        - Loading the tab image.
         - Creating labels and entry fields for activity name, duration, intensity.
         - Adding a button to log activities.
-        - Displaying a text widget to show logged activities.
+        - Displaying a list to show logged activities.
         """
-        # Label and Entry for Activity Name
-        tk.Label(self.activity_tab, text="Activity Name:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=0, column=0, padx=10, pady=5, sticky="e")
+        # Load the image for the Activity tab
+        self.load_activity_image()
+
+        # Labels for the activity fields
+        for row, text in enumerate(("Activity Name:", "Duration (min):", "Intensity:")):
+            self._label(self.activity_tab, text, row)
+
+        # Entry for Activity Name
         self.activity_name = tk.Entry(self.activity_tab, width=25, bg="white", fg="black")  # Entry for activity name
         self.activity_name.grid(row=0, column=1, padx=10, pady=5, sticky="w")
 
-        # Label and Entry for Duration
-        tk.Label(self.activity_tab, text="Duration (min):", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=1, column=0, padx=10, pady=5, sticky="e")
-        self.activity_duration = tk.Entry(self.activity_tab, width=25, bg="white", fg="black")  # Entry for activity duration
+        # Entry for Duration
+        self.activity_duration = tk.Entry(self.activity_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for activity duration
         self.activity_duration.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
-        # Label and ComboBox for Intensity
-        tk.Label(self.activity_tab, text="Intensity:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=2, column=0, padx=10, pady=5, sticky="e")
-        self.intensity = ttk.Combobox(self.activity_tab, values=["Low", "Medium", "High"], width=23)  # Dropdown for intensity levels
+        # ComboBox for Intensity
+        self.intensity = ttk.Combobox(self.activity_tab, values=INTENSITY_LEVELS, width=23)  # Dropdown for intensity levels
         self.intensity.grid(row=2, column=1, padx=10, pady=5, sticky="w")
 
         # Button to log the activity
-        log_button = tk.Button(self.activity_tab, text="Log Activity", command=self.log_activity, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        log_button = tk.Button(self.activity_tab, text="Log Activity", command=self.log_activity, bg=self.highlight_color, fg="black", font=self.font_bold)
         log_button.grid(row=3, column=0, columnspan=2, pady=10)
 
-        # Text widget to display logged activities
-        self.activity_list = tk.Text(self.activity_tab, height=15, width=50, bg="white", fg="black", font=('Arial', 10))
+        # List to display logged activities
+        self.activity_list = self._history_list(self.activity_tab, ACTIVITY_COLUMNS, ACTIVITY_EMPTY)
         self.activity_list.grid(row=4, column=0, columnspan=2, padx=10, pady=5)
 
         # Load existing activities from the database
@@ -196,8 +405,8 @@ class FitnessApp(tk.Tk):
     def log_activity(self):
         """
         Logs the activity input by the user into the database.
-        Checks for input validation (non-empty fields and numeric duration).
-        On success, displays a message and refreshes the activity list.
+        Checks for input validation (non-empty fields and a known intensity; duration only accepts digits).
+        The insert runs on the database thread; on success a message is displayed and the activity list is refreshed.
         """
         name = self.activity_name.get()    # Get activity name from entry
         duration = self.activity_duration.get()  # Get duration as a string
@@ -205,88 +414,93 @@ class FitnessApp(tk.Tk):
 
         # Validation: All fields must be filled
         if not name or not duration or not intensity:
-            messagebox.showerror("Input Error", "All fields are required!")
+            showerror("Input Error", "All fields are required!")
             return
 
-        # Validation: Duration must be numeric
-        try:
-            duration = int(duration)
-        except ValueError:
-            messagebox.showerror("Input Error", "Duration must be a number!")
+        # Validation: Intensity must be one of the offered levels (the Combobox also accepts typed text)
+        if intensity not in _INTENSITIES:
+            showerror("Input Error", f"Intensity must be {', '.join(INTENSITY_LEVELS[:-1])}, or {INTENSITY_LEVELS[-1]}!")
             return
 
-        # Insert the activity into the database
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("INSERT INTO activities (activity_name, duration, intensity) VALUES (?, ?, ?)",
-                       (name, duration, intensity))
-        conn.commit()
-        conn.close()
+        duration = int(duration)  # The entry only accepts digits
+
+        # Queue the activity to be inserted into the database
+        self.db_queue.put((self._bulk_insert_activities, ([(name, duration, intensity)],),
+                           lambda: self._activity_logged(name, duration, intensity)))
 
+    def _activity_logged(self, name, duration, intensity):
+        """
+        Called on the main thread once a logged activity has been written to the database.
+        Adds the new entry to the top of the activity list instead of reloading the whole list.
+        """
         # Confirm success to user
         messagebox.showinfo("Success", "Activity logged successfully!")
-        # Reload the activity list to show the new entry
-        self.load_activities()
+
+        # Show the new entry first, using the same UTC date SQLite stored
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        self._prepend_history(self.activity_list, (name, duration, intensity, today))
+
+    def _bulk_insert_activities(self, conn, rows):
+        """
+        Inserts (activity_name, duration, intensity) rows into the database in a single transaction.
+        Used for single entries as well as bulk imports so all writes share one prepared statement.
+        """
+        with conn:
+            conn.executemany("INSERT INTO activities (activity_name, duration, intensity) VALUES (?, ?, ?)", rows)
 
     def load_activities(self):
         """
-        Loads all activities from the database and displays them in the activity_list Text widget.
+        Loads the most recent activities (newest first) from the database and displays them in the activity_list Treeview.
         If no activities are found, displays a default message.
         """
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("SELECT activity_name, duration, intensity, date FROM activities")
-        records = cursor.fetchall()
-        conn.close()
-
-        # Clear the text widget before inserting new data
-        self.activity_list.delete(1.0, tk.END)
-
-        # Display activities or a 'no records' message
-        if records:
-            for record in records:
-                self.activity_list.insert(tk.END, f"{record[0]} - {record[1]} min - {record[2]} - {record[3]}\n")
-        else:
-            self.activity_list.insert(tk.END, "No activities logged yet.\n")
+        # Rows are streamed from the cursor rather than materialized with fetchall()
+        rows = self.cursor.execute("""
+            SELECT activity_name, duration, intensity, date FROM activities
+            ORDER BY date DESC, id DESC LIMIT ?
+        """, (HISTORY_LIMIT,))
+        self._fill_history(self.activity_list, rows, ACTIVITY_EMPTY)
 
     def init_nutrition_tab(self):
         """
         Initializes the Nutrition Logging tab by:
+        - Loading the tab image.
         - Creating labels and entry fields for food item, calories, carbs, protein, and fats.
         - Adding a button to log nutrition.
-        - Displaying a text widget to show logged nutrition entries.
+        - Displaying a list to show logged nutrition entries.
         """
-        # Food Item label and entry
-        tk.Label(self.nutrition_tab, text="Food Item:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=0, column=0, padx=10, pady=5, sticky="e")
+        # Load the image for the Nutrition tab
+        self.load_nutrition_image()
+
+        # Labels for the nutrition fields
+        for row, text in enumerate(("Food Item:", "Calories:", "Carbs (g):", "Protein (g):", "Fats (g):")):
+            self._label(self.nutrition_tab, text, row)
+
+        # Food Item entry
         self.food_item = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black")  # Entry for food item name
         self.food_item.grid(row=0, column=1, padx=10, pady=5, sticky="w")
 
-        # Calories label and entry
-        tk.Label(self.nutrition_tab, text="Calories:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=1, column=0, padx=10, pady=5, sticky="e")
-        self.calories = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black")  # Entry for calorie amount
+        # Calories entry
+        self.calories = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for calorie amount
         self.calories.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
-        # Carbs label and entry
-        tk.Label(self.nutrition_tab, text="Carbs (g):", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=2, column=0, padx=10, pady=5, sticky="e")
-        self.carbs = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black")  # Entry for carbs
+        # Carbs entry
+        self.carbs = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for carbs
         self.carbs.grid(row=2, column=1, padx=10, pady=5, sticky="w")
 
-        # Protein label and entry
-        tk.Label(self.nutrition_tab, text="Protein (g):", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=3, column=0, padx=10, pady=5, sticky="e")
-        self.protein = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black")  # Entry for protein
+        # Protein entry
+        self.protein = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for protein
         self.protein.grid(row=3, column=1, padx=10, pady=5, sticky="w")
 
-        # Fats label and entry
-        tk.Label(self.nutrition_tab, text="Fats (g):", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=4, column=0, padx=10, pady=5, sticky="e")
-        self.fats = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black")  # Entry for fats
+        # Fats entry
+        self.fats = tk.Entry(self.nutrition_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for fats
         self.fats.grid(row=4, column=1, padx=10, pady=5, sticky="w")
 
         # Button to log nutrition
-        log_button = tk.Button(self.nutrition_tab, text="Log Nutrition", command=self.log_nutrition, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        log_button = tk.Button(self.nutrition_tab, text="Log Nutrition", command=self.log_nutrition, bg=self.highlight_color, fg="black", font=self.font_bold)
         log_button.grid(row=5, column=0, columnspan=2, pady=10)
 
-        # Text widget to display logged nutrition
-        self.nutrition_list = tk.Text(self.nutrition_tab, height=15, width=50, bg="white", fg="black", font=('Arial', 10))
+        # List to display logged nutrition
+        self.nutrition_list = self._history_list(self.nutrition_tab, NUTRITION_COLUMNS, NUTRITION_EMPTY)
         self.nutrition_list.grid(row=6, column=0, columnspan=2, padx=10, pady=5)
 
         # Load existing nutrition data from the database
@@ -295,8 +509,8 @@ class FitnessApp(tk.Tk):
     def log_nutrition(self):
         """
         Logs nutrition information provided by the user into the database.
-        Validates required fields and numeric types.
-        On success, shows a message and refreshes the nutrition list.
+        Validates required fields; the numeric fields only accept digits.
+        The insert runs on the database thread; on success a message is shown and the nutrition list is refreshed.
         """
         food_item = self.food_item.get()   # Get food item name
         calories = self.calories.get()     # Get calories input
@@ -306,54 +520,53 @@ class FitnessApp(tk.Tk):
 
         # Validation: Food item and calories must not be empty
         if not food_item or not calories:
-            messagebox.showerror("Input Error", "Food Item and Calories are required!")
+            showerror("Input Error", "Food Item and Calories are required!")
             return
 
-        # Validation: Calories and macros must be numeric if provided
-        try:
-            calories = int(calories)
-            carbs = int(carbs) if carbs else 0
-            protein = int(protein) if protein else 0
-            fats = int(fats) if fats else 0
-        except ValueError:
-            messagebox.showerror("Input Error", "Calories, Carbs, Protein, and Fats must be numbers!")
-            return
+        # The entries only accept digits; macros default to 0 if not provided
+        calories = int(calories)
+        carbs = int(carbs) if carbs else 0
+        protein = int(protein) if protein else 0
+        fats = int(fats) if fats else 0
 
         # Insert the nutrition entry into the database
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO nutrition (food_item, calories, carbs, protein, fats) 
-            VALUES (?, ?, ?, ?, ?)
-        """, (food_item, calories, carbs, protein, fats))
-        conn.commit()
-        conn.close()
+        self.db_queue.put((self._bulk_insert_nutrition, ([(food_item, calories, carbs, protein, fats)],),
+                           lambda: self._nutrition_logged(food_item, calories, carbs, protein, fats)))
 
+    def _nutrition_logged(self, food_item, calories, carbs, protein, fats):
+        """
+        Called on the main thread once a nutrition entry has been written to the database.
+        Adds the new entry to the top of the nutrition list instead of reloading the whole list.
+        """
         # Inform the user of successful logging
         messagebox.showinfo("Success", "Nutrition logged successfully!")
-        # Reload the nutrition list to reflect the new entry
-        self.load_nutrition()
+
+        # Show the new entry first, using the same UTC date SQLite stored
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        self._prepend_history(self.nutrition_list, (food_item, calories, carbs, protein, fats, today))
+
+    def _bulk_insert_nutrition(self, conn, rows):
+        """
+        Inserts (food_item, calories, carbs, protein, fats) rows into the database in a single transaction.
+        Used for single entries as well as bulk imports so all writes share one prepared statement.
+        """
+        with conn:
+            conn.executemany("""
+                INSERT INTO nutrition (food_item, calories, carbs, protein, fats) 
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
 
     def load_nutrition(self):
         """
-        Loads all nutrition records from the database and displays them in the nutrition_list Text widget.
+        Loads the most recent nutrition records (newest first) from the database and displays them in the nutrition_list Treeview.
         If no records exist, displays a default message.
         """
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("SELECT food_item, calories, carbs, protein, fats, date FROM nutrition")
-        records = cursor.fetchall()
-        conn.close()
-
-        # Clear current text widget content
-        self.nutrition_list.delete(1.0, tk.END)
-
-        # Display each record or a 'no records' message
-        if records:
-            for record in records:
-                self.nutrition_list.insert(tk.END, f"{record[0]} - {record[1]} cal - {record[2]}g carbs - {record[3]}g protein - {record[4]}g fats - {record[5]}\n")
-        else:
-            self.nutrition_list.insert(tk.END, "No nutrition records found.\n")
+        # Rows are streamed from the cursor rather than materialized with fetchall()
+        rows = self.cursor.execute("""
+            SELECT food_item, calories, carbs, protein, fats, date FROM nutrition
+            ORDER BY date DESC, id DESC LIMIT ?
+        """, (HISTORY_LIMIT,))
+        self._fill_history(self.nutrition_list, rows, NUTRITION_EMPTY)
 
     def init_goal_tab(self):
         """
@@ -364,62 +577,69 @@ class FitnessApp(tk.Tk):
         - An exit button to close the application.
         - A label to display the current set goals.
         """
-        # Label and Entry for Weekly Exercise Goal
-        tk.Label(self.goal_tab, text="Weekly Exercise Goal (hours):", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=0, column=0, padx=10, pady=5, sticky="e")
-        self.exercise_goal = tk.Entry(self.goal_tab, width=25, bg="white", fg="black")  # Entry for weekly exercise goal
+        # Labels for the goal fields
+        for row, text in enumerate(("Weekly Exercise Goal (hours):", "Daily Calorie Limit:")):
+            self._label(self.goal_tab, text, row)
+
+        # Entry for Weekly Exercise Goal
+        self.exercise_goal = tk.Entry(self.goal_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for weekly exercise goal
         self.exercise_goal.grid(row=0, column=1, padx=10, pady=5, sticky="w")
 
-        # Label and Entry for Daily Calorie Limit
-        tk.Label(self.goal_tab, text="Daily Calorie Limit:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).grid(row=1, column=0, padx=10, pady=5, sticky="e")
-        self.calorie_limit = tk.Entry(self.goal_tab, width=25, bg="white", fg="black")  # Entry for daily calorie limit
+        # Entry for Daily Calorie Limit
+        self.calorie_limit = tk.Entry(self.goal_tab, width=25, bg="white", fg="black", validate="key", validatecommand=self._vcmd_int)  # Entry for daily calorie limit
         self.calorie_limit.grid(row=1, column=1, padx=10, pady=5, sticky="w")
 
         # Button to Set Goals
-        goal_button = tk.Button(self.goal_tab, text="Set Goals", command=self.set_goals, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        goal_button = tk.Button(self.goal_tab, text="Set Goals", command=self.set_goals, bg=self.highlight_color, fg="black", font=self.font_bold)
         goal_button.grid(row=2, column=0, columnspan=2, pady=10)
 
         # Button to View Summary (opens a separate window)
-        summary_button = tk.Button(self.goal_tab, text="View Summary", command=self.open_summary_window, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        summary_button = tk.Button(self.goal_tab, text="View Summary", command=self.open_summary_window, bg=self.highlight_color, fg="black", font=self.font_bold)
         summary_button.grid(row=3, column=0, columnspan=2, pady=10)
 
         # Exit button to close the application
-        exit_button = tk.Button(self.goal_tab, text="Exit Application", command=self.exit_application, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        exit_button = tk.Button(self.goal_tab, text="Exit Application", command=self.exit_application, bg=self.highlight_color, fg="black", font=self.font_bold)
         exit_button.grid(row=4, column=0, columnspan=2, pady=10)
 
         # Label to display current goals
-        self.goal_status = tk.Label(self.goal_tab, text="", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 12, 'bold'))
+        self.goal_status = tk.Label(self.goal_tab, text="", bg=self.frame_bg, fg=self.fg_color, font=self.font_title)
         self.goal_status.grid(row=5, column=0, columnspan=2, pady=10)
 
     def set_goals(self):
         """
         Sets the user's goals in the database.
-        Validates that both fields are filled and numeric.
-        On success, updates the goal_status label and displays a success message.
+        Validates that both fields are filled; they only accept digits.
+        The write runs on the database thread; on success the goal_status label is updated and a success message is displayed.
         """
         exercise_goal = self.exercise_goal.get()  # Weekly exercise goal as string
         calorie_limit = self.calorie_limit.get()  # Daily calorie limit as string
 
         # Validation: Both fields required
         if not exercise_goal or not calorie_limit:
-            messagebox.showerror("Input Error", "All fields are required!")
+            showerror("Input Error", "All fields are required!")
             return
 
-        # Validation: Both values must be integers
-        try:
-            exercise_goal = int(exercise_goal)
-            calorie_limit = int(calorie_limit)
-        except ValueError:
-            messagebox.showerror("Input Error", "Goals must be numbers!")
-            return
+        # The entries only accept digits
+        exercise_goal = int(exercise_goal)
+        calorie_limit = int(calorie_limit)
 
-        # Insert or update goals in the database
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM goals")  # Clear old goals and store only the latest
-        cursor.execute("INSERT INTO goals (weekly_exercise_goal, daily_calorie_limit) VALUES (?, ?)",
-                       (exercise_goal, calorie_limit))
-        conn.commit()
-        conn.close()
+        # Queue the goals to be saved in the database
+        self.db_queue.put((self._save_goals, (exercise_goal, calorie_limit),
+                           lambda: self._goals_set(exercise_goal, calorie_limit)))
+
+    def _save_goals(self, conn, exercise_goal, calorie_limit):
+        """
+        Updates the single goals row (id 1), created by setup_database, in place.
+        """
+        with conn:
+            conn.execute("UPDATE goals SET weekly_exercise_goal = ?, daily_calorie_limit = ? WHERE id = 1",
+                         (exercise_goal, calorie_limit))
+
+    def _goals_set(self, exercise_goal, calorie_limit):
+        """
+        Called on the main thread once the goals have been written to the database.
+        """
+        self._goal_cache = (exercise_goal, calorie_limit)  # Keep the summary window in sync without a query
 
         # Update the status label to show the newly set goals
         self.goal_status.config(text=f"Weekly Goal: {exercise_goal} hrs | Daily Limit: {calorie_limit} cal")
@@ -428,7 +648,7 @@ class FitnessApp(tk.Tk):
     def open_summary_window(self):
         """
         Opens a new TopLevel window to display the user's current goals.
-        Queries the database for the latest goals and displays them.
+        Displays the cached goals, querying the database for them the first time.
         If no goals are set, shows a message stating so.
         """
         summary_window = tk.Toplevel(self)  # Create a new window on top of the main window
@@ -437,34 +657,44 @@ class FitnessApp(tk.Tk):
         summary_window.configure(bg=self.frame_bg)
 
         # Label in the summary window
-        tk.Label(summary_window, text="Your Current Goals:", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 12, 'bold')).pack(pady=10)
+        tk.Label(summary_window, text="Your Current Goals:", bg=self.frame_bg, fg=self.fg_color, font=self.font_title).pack(pady=10)
 
-        # Get the latest goals from the database
-        conn = sqlite3.connect('fitness_tracker.db')
-        cursor = conn.cursor()
-        cursor.execute("SELECT weekly_exercise_goal, daily_calorie_limit FROM goals ORDER BY id DESC LIMIT 1")
-        goal = cursor.fetchone()
-        conn.close()
+        # Get the latest goals, querying the database only if they are not cached yet
+        if self._goal_cache is None:
+            self.cursor.execute("SELECT weekly_exercise_goal, daily_calorie_limit FROM goals WHERE id = 1")
+            self._goal_cache = self.cursor.fetchone()
+        goal = self._goal_cache
 
-        # Display goals if present, otherwise show a no-goals message
-        if goal:
+        # Display goals if present, otherwise show a no-goals message (the goals row starts out empty)
+        if goal and goal[0] is not None:
             weekly_goal, daily_cal = goal
-            tk.Label(summary_window, text=f"Weekly Exercise: {weekly_goal} hrs", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).pack(pady=5)
-            tk.Label(summary_window, text=f"Daily Calorie Limit: {daily_cal} cal", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).pack(pady=5)
+            tk.Label(summary_window, text=f"Weekly Exercise: {weekly_goal} hrs", bg=self.frame_bg, fg=self.fg_color, font=self.font_label).pack(pady=5)
+            tk.Label(summary_window, text=f"Daily Calorie Limit: {daily_cal} cal", bg=self.frame_bg, fg=self.fg_color, font=self.font_label).pack(pady=5)
         else:
-            tk.Label(summary_window, text="No goals set yet.", bg=self.frame_bg, fg=self.fg_color, font=('Arial', 11)).pack(pady=10)
+            tk.Label(summary_window, text="No goals set yet.", bg=self.frame_bg, fg=self.fg_color, font=self.font_label).pack(pady=10)
 
         # Close button to destroy the summary window
-        close_button = tk.Button(summary_window, text="Close", command=summary_window.destroy, bg=self.highlight_color, fg="black", font=('Arial', 11, 'bold'))
+        close_button = tk.Button(summary_window, text="Close", command=summary_window.destroy, bg=self.highlight_color, fg="black", font=self.font_bold)
         close_button.pack(pady=10)
 
     def exit_application(self):
         """
         Asks for confirmation before closing the application.
-        If confirmed, destroys the main application window and ends the program.
+        If confirmed, shuts the application down.
         """
         if messagebox.askyesno("Exit", "Are you sure you want to exit the application?"):
-            self.destroy()  # Close the main window and exit
+            self.shutdown()
+
+    def shutdown(self):
+        """
+        Lets the database thread finish pending writes and reports their results,
+        then closes the database connection and destroys the main application window.
+        """
+        self.db_queue.put(None)  # Stop the database thread after any queued writes
+        self.db_thread.join()
+        self._run_db_results()  # Show the outcome of the final writes, including any error
+        self.conn.close()  # Release the shared database connection
+        self.destroy()  # Close the main window and exit
 
 
 # ---------------------- Main Entry Point ----------------------